@@ -255,6 +255,7 @@ from mlflow.protos.databricks_pb2 import (
 from mlflow.pyfunc.model import (
     PythonModel,
     PythonModelContext,  # noqa: F401
+    _accepts_params,
     _log_warning_if_params_not_in_predict_signature,
     _PythonModelPyfuncWrapper,
     get_default_conda_env,  # noqa: F401
@@ -473,7 +474,7 @@ class PyFuncModel:
             # Models saved prior to MLflow 2.5.0 do not support `params` in the pyfunc `predict()`
             # function definition, nor do they support `**kwargs`. Accordingly, we only pass
             # `params` to the `predict()` method if it defines the `params` argument
-            if inspect.signature(self._predict_fn).parameters.get("params"):
+            if _accepts_params(self._predict_fn):
                 return self._predict_fn(data, params=params)
             _log_warning_if_params_not_in_predict_signature(_logger, params)
             return self._predict_fn(data)
@@ -706,7 +707,7 @@ class _ServedPyFuncModel(PyFuncModel):
 
         :return: Model predictions.
         """
-        if inspect.signature(self._client.invoke).parameters.get("params"):
+        if _accepts_params(self._client.invoke):
             result = self._client.invoke(data, params=params).get_predictions()
         else:
             _log_warning_if_params_not_in_predict_signature(_logger, params)
@@ -1574,7 +1575,7 @@ Compound types:
                 raise MlflowException(err_msg) from e
 
             def batch_predict_fn(pdf, params=None):
-                if inspect.signature(client.invoke).parameters.get("params"):
+                if _accepts_params(client.invoke):
                     return client.invoke(pdf, params=params).get_predictions()
                 _log_warning_if_params_not_in_predict_signature(_logger, params)
                 return client.invoke(pdf).get_predictions()
@@ -1597,7 +1598,7 @@ Compound types:
                 loaded_model = mlflow.pyfunc.load_model(local_model_path)
 
             def batch_predict_fn(pdf, params=None):
-                if inspect.signature(loaded_model.predict).parameters.get("params"):
+                if _accepts_params(loaded_model.predict):
                     return loaded_model.predict(pdf, params=params)
                 _log_warning_if_params_not_in_predict_signature(_logger, params)
                 return loaded_model.predict(pdf)
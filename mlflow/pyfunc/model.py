@@ -7,6 +7,7 @@ import inspect
 import logging
 import os
 import shutil
+import weakref
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -65,6 +66,34 @@ def get_default_conda_env():
     return _mlflow_conda_env(additional_pip_deps=get_default_pip_requirements())
 
 
+# Maps predict functions to whether they accept `params`. Keys are weak references so that a
+# cached function, and any model it references, can still be garbage collected.
+_ACCEPTS_PARAMS_CACHE = weakref.WeakKeyDictionary()
+
+
+def _accepts_params(predict_fn):
+    """
+    Returns True if ``predict_fn`` defines a ``params`` argument.
+
+    This check runs on every prediction, so the result is cached per function without keeping the
+    function alive. Bound methods are keyed by their underlying function, so all instances of a
+    class share one entry. Callables that can't be hashed or weakly referenced are not cached and
+    are inspected on every call.
+    """
+    func = getattr(predict_fn, "__func__", predict_fn)
+    try:
+        accepts_params = _ACCEPTS_PARAMS_CACHE.get(func)
+        cacheable = True
+    except TypeError:
+        accepts_params = None
+        cacheable = False
+    if accepts_params is None:
+        accepts_params = "params" in inspect.signature(func).parameters
+        if cacheable:
+            _ACCEPTS_PARAMS_CACHE[func] = accepts_params
+    return accepts_params
+
+
 def _log_warning_if_params_not_in_predict_signature(logger, params):
     if params:
         logger.warning(
@@ -148,7 +177,7 @@ class _FunctionPythonModel(PythonModel):
 
         :return: Model predictions.
         """
-        if inspect.signature(self.func).parameters.get("params"):
+        if _accepts_params(self.func):
             return self.func(model_input, params=params)
         _log_warning_if_params_not_in_predict_signature(_logger, params)
         return self.func(model_input)
@@ -465,7 +494,7 @@ class _PythonModelPyfuncWrapper:
 
         :return: Model predictions.
         """
-        if inspect.signature(self.python_model.predict).parameters.get("params"):
+        if _accepts_params(self.python_model.predict):
             return self.python_model.predict(
                 self.context, self._convert_input(model_input), params=params
             )
@@ -12,7 +12,6 @@ Defines four endpoints:
     /version used for getting the mlflow version
     /invocations used for scoring
 """
-import inspect
 import json
 import logging
 import os
@@ -31,7 +30,10 @@ from mlflow.environment_variables import MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT
 # dependencies to the minimum here.
 # ALl of the mlflow dependencies below need to be backwards compatible.
 from mlflow.exceptions import MlflowException
-from mlflow.pyfunc.model import _log_warning_if_params_not_in_predict_signature
+from mlflow.pyfunc.model import (
+    _accepts_params,
+    _log_warning_if_params_not_in_predict_signature,
+)
 from mlflow.types import Schema
 from mlflow.utils import reraise
 from mlflow.utils.annotations import deprecated
@@ -317,7 +319,7 @@ def invocations(data, content_type, model, input_schema):
 
     # Do the prediction
     try:
-        if inspect.signature(model.predict).parameters.get("params"):
+        if _accepts_params(model.predict):
             raw_predictions = model.predict(data, params=params)
         else:
             _log_warning_if_params_not_in_predict_signature(_logger, params)
@@ -404,7 +406,7 @@ def _predict(model_uri, input_path, output_path, content_type):
     else:
         raise Exception(f"Unknown content type '{content_type}'")
 
-    if inspect.signature(pyfunc_model.predict).parameters.get("params"):
+    if _accepts_params(pyfunc_model.predict):
         raw_predictions = pyfunc_model.predict(df, params=params)
     else:
         _log_warning_if_params_not_in_predict_signature(_logger, params)
@@ -1,12 +1,14 @@
 import argparse
-import inspect
 import json
 import logging
 import sys
 
 import mlflow
 from mlflow.pyfunc import scoring_server
-from mlflow.pyfunc.model import _log_warning_if_params_not_in_predict_signature
+from mlflow.pyfunc.model import (
+    _accepts_params,
+    _log_warning_if_params_not_in_predict_signature,
+)
 
 _logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +33,7 @@ for line in sys.stdin:
     data = scoring_server.infer_and_parse_data(data, input_schema)
 
     _logger.info("Making predictions")
-    if inspect.signature(model.predict).parameters.get("params"):
+    if _accepts_params(model.predict):
         preds = model.predict(data, params=params)
     else:
         _log_warning_if_params_not_in_predict_signature(_logger, params)
@@ -156,6 +156,15 @@ def parse_dict(js_dict, message):
     ParseDict(js_dict=js_dict, message=message, ignore_unknown_fields=True)
 
 
+def _encode_binary(x):
+    return base64.encodebytes(x).decode("ascii")
+
+
+# Types that `json` encodes natively. `NumpyEncoder.try_convert` returns them as is without
+# importing numpy, which matters for object arrays where every element goes through it.
+_JSON_NATIVE_TYPES = frozenset([str, int, float, bool, type(None), list, dict])
+
+
 class NumpyEncoder(JSONEncoder):
     """Special json encoder for numpy types.
     Note that some numpy types doesn't have native python equivalence,
@@ -164,28 +173,29 @@ class NumpyEncoder(JSONEncoder):
     """
 
     def try_convert(self, o):
-        import numpy as np
-        import pandas as pd
+        if type(o) in _JSON_NATIVE_TYPES:
+            return o, False
+        if isinstance(o, (bytes, bytearray)):
+            return _encode_binary(o), True
+        # NB: `pd.Timestamp` is a subclass of `datetime.datetime`, so pandas doesn't need to be
+        # imported on every call to handle it
+        if isinstance(o, (datetime.date, datetime.datetime, datetime.time)):
+            return o.isoformat(), True
 
-        def encode_binary(x):
-            return base64.encodebytes(x).decode("ascii")
+        import numpy as np
 
         if isinstance(o, np.ndarray):
             if o.dtype == object:
                 return [self.try_convert(x)[0] for x in o.tolist()], True
             elif o.dtype == np.bytes_:
-                return np.vectorize(encode_binary)(o), True
+                return np.vectorize(_encode_binary)(o), True
             else:
                 return o.tolist(), True
 
         if isinstance(o, np.generic):
             return o.item(), True
-        if isinstance(o, (bytes, bytearray)):
-            return encode_binary(o), True
         if isinstance(o, np.datetime64):
             return np.datetime_as_string(o), True
-        if isinstance(o, (pd.Timestamp, datetime.date, datetime.datetime, datetime.time)):
-            return o.isoformat(), True
         return o, False
 
     def default(self, o):
@@ -459,9 +469,9 @@ def parse_tf_serving_input(inp_dict, schema=None):
 class _CustomJsonEncoder(json.JSONEncoder):
     def default(self, o):
         import numpy as np
-        import pandas as pd
 
-        if isinstance(o, (datetime.datetime, datetime.date, datetime.time, pd.Timestamp)):
+        # NB: `pd.Timestamp` is a subclass of `datetime.datetime`
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
             return o.isoformat()
 
         if isinstance(o, np.ndarray):
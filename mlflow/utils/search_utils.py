@@ -28,6 +28,11 @@ from mlflow.utils.mlflow_tags import (
     MLFLOW_DATASET_CONTEXT,
 )
 
+# Evaluated once at import time since search filters and order_by clauses are parsed per request
+_SQLPARSE_VERSION = Version(sqlparse.__version__)
+_SQLPARSE_TREATS_IN_AS_COMPARISON = _SQLPARSE_VERSION < Version("0.4.4")
+_SQLPARSE_TIMESTAMP_IS_BUILTIN_NAME = _SQLPARSE_VERSION >= Version("0.4.3")
+
 
 def _convert_like_pattern_to_regex(pattern, flags=0):
     if not pattern.startswith("%"):
@@ -50,7 +55,7 @@ def _join_in_comparison_tokens(tokens):
     Find a sequence of tokens that matches the pattern of an IN comparison or a NOT IN comparison,
     join the tokens into a single Comparison token. Otherwise, return the original list of tokens.
     """
-    if Version(sqlparse.__version__) < Version("0.4.4"):
+    if _SQLPARSE_TREATS_IN_AS_COMPARISON:
         # In sqlparse < 0.4.4, IN is treated as a comparison, we don't need to join tokens
         return tokens
 
@@ -620,9 +625,7 @@ class SearchUtils:
             )
         statement = parsed[0]
         ttype_for_timestamp = (
-            TokenType.Name.Builtin
-            if Version(sqlparse.__version__) >= Version("0.4.3")
-            else TokenType.Keyword
+            TokenType.Name.Builtin if _SQLPARSE_TIMESTAMP_IS_BUILTIN_NAME else TokenType.Keyword
         )
 
         if len(statement.tokens) == 1 and isinstance(statement[0], Identifier):
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import gc
 import json
 import os
 import sys
 import uuid
+import weakref
 from subprocess import PIPE, Popen
 from typing import Any, Dict, List, Tuple
 from unittest import mock
@@ -28,7 +30,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.models import Model, infer_signature
 from mlflow.models.model import _DATABRICKS_FS_LOADER_MODULE
 from mlflow.models.utils import _read_example
-from mlflow.pyfunc.model import _load_pyfunc
+from mlflow.pyfunc.model import _ACCEPTS_PARAMS_CACHE, _accepts_params, _load_pyfunc
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 from mlflow.tracking.artifact_utils import (
     _download_artifact_from_uri,
@@ -1426,6 +1428,77 @@ def test_python_model_predict_with_params():
     assert loaded_model.predict(["a", "b"], params={"foo": np.array([0, 1])}) == ["a", "b"]
 
 
+def test_accepts_params():
+    class WithParams(mlflow.pyfunc.PythonModel):
+        def predict(self, context, model_input, params=None):
+            return model_input
+
+    class WithoutParams(mlflow.pyfunc.PythonModel):
+        def predict(self, context, model_input):
+            return model_input
+
+    def predict_fn(model_input, params=None):
+        return model_input
+
+    assert _accepts_params(WithParams().predict)
+    assert not _accepts_params(WithoutParams().predict)
+    assert _accepts_params(predict_fn)
+    assert not _accepts_params(lambda model_input: model_input)
+
+
+def test_accepts_params_caches_bound_methods_by_function():
+    class Model(mlflow.pyfunc.PythonModel):
+        def predict(self, context, model_input, params=None):
+            return model_input
+
+    model_1, model_2 = Model(), Model()
+    assert _accepts_params(model_1.predict)
+    assert _accepts_params(model_2.predict)
+    assert Model.predict in _ACCEPTS_PARAMS_CACHE
+    assert _ACCEPTS_PARAMS_CACHE[Model.predict] is True
+    for model in (model_1, model_2):
+        assert model not in _ACCEPTS_PARAMS_CACHE
+        assert model.predict not in _ACCEPTS_PARAMS_CACHE
+
+
+def test_accepts_params_with_unhashable_callable():
+    class UnhashableCallable:
+        __hash__ = None
+
+        def __call__(self, model_input, params=None):
+            return model_input
+
+    predict_fn = UnhashableCallable()
+    cache = mock.MagicMock(wraps=weakref.WeakKeyDictionary())
+    with mock.patch("mlflow.pyfunc.model._ACCEPTS_PARAMS_CACHE", cache):
+        assert _accepts_params(predict_fn)
+    cache.get.assert_called_once_with(predict_fn)
+    cache.__setitem__.assert_not_called()
+    with pytest.raises(TypeError, match="unhashable"):
+        cache.get(predict_fn)
+
+
+def test_accepts_params_does_not_keep_closures_alive():
+    class Model:
+        pass
+
+    def make_predict_fn(model):
+        def predict_fn(model_input, params=None):
+            return model
+
+        return predict_fn
+
+    model = Model()
+    model_ref = weakref.ref(model)
+    predict_fn = make_predict_fn(model)
+    assert _accepts_params(predict_fn)
+    assert predict_fn in _ACCEPTS_PARAMS_CACHE
+
+    del model, predict_fn
+    gc.collect()
+    assert model_ref() is None
+
+
 def test_artifact_path_posix(sklearn_knn_model, main_scoped_model_class, tmp_path):
     sklearn_model_path = tmp_path.joinpath("sklearn_model")
     mlflow.sklearn.save_model(sk_model=sklearn_knn_model, path=sklearn_model_path)
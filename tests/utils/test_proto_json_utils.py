@@ -16,6 +16,7 @@ from mlflow.protos.service_pb2 import Metric as ProtoMetric
 from mlflow.types import ColSpec, Schema, TensorSpec
 from mlflow.utils.proto_json_utils import (
     MlflowFailedTypeConversion,
+    NumpyEncoder,
     _CustomJsonEncoder,
     _stringify_all_experiment_ids,
     cast_df_types_according_to_schema,
@@ -571,6 +572,22 @@ def test_dataframe_from_json():
 )
 def test_datetime_encoder(dt, expected):
     assert json.dumps(dt, cls=_CustomJsonEncoder) == expected
+    assert json.dumps(dt, cls=NumpyEncoder) == expected
+
+
+def test_numpy_encoder_object_array():
+    data = np.array(
+        [1, "a", None, np.int64(2), b"bytes", [1.5], pd.Timestamp(2022, 1, 1)], dtype=object
+    )
+    assert json.loads(json.dumps(data, cls=NumpyEncoder)) == [
+        1,
+        "a",
+        None,
+        2,
+        "Ynl0ZXM=\n",
+        [1.5],
+        "2022-01-01T00:00:00",
+    ]
 
 
 @pytest.mark.parametrize(